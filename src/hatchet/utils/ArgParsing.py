@@ -57,6 +57,8 @@ def parse_baf_arguments(args=None):
         normal = (normalbaf, names[0])
         for i in range(len(tumors)):
             samples.add((tumors[i], names[i+1]))
+    if len({normal[1]} | {sample[1] for sample in samples}) != len(tumors) + 1:
+        raise ValueError(sp.error("Sample names must be unique across the normal and tumor BAMs, please use distinct file names or specify the sample names explicitly"))
 
     # In default mode, check the existence and compatibility of samtools and bcftools
     samtools = os.path.join(args.samtools, "samtools")
@@ -165,6 +167,8 @@ def parse_bin_arguments(args=None):
         normal = (normalbaf, names[0])
         for i in range(len(tumors)):
             samples.add((tumors[i], names[i+1]))
+    if len({normal[1]} | {sample[1] for sample in samples}) != len(tumors) + 1:
+        raise ValueError(sp.error("Sample names must be unique across the normal and tumor BAMs, please use distinct file names or specify the sample names explicitly"))
 
     # Check the region file
     if args.regions is not None and not os.path.isfile(args.regions):
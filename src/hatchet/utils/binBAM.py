@@ -30,38 +30,33 @@ def main(args=None):
         msg += "\n"
         log(msg=msg, level="INFO")
 
-    log(msg="# Binning and counting the normal sample\n", level="STEP")
-    normal_bins = bb.bin(samtools=args["samtools"], samples=[args["normal"]], chromosomes=args["chromosomes"],
-                         num_workers=args["j"], q=args["q"], size=args["size"], regions=regions, verbose=args["verbose"])
-    if not normal_bins: close("No bins in the normal sample!\n")
+    log(msg="# Binning and counting the normal and tumor samples\n", level="STEP")
+    bins = bb.bin(samtools=args["samtools"], samples=({args["normal"]}|args["samples"]), chromosomes=args["chromosomes"],
+                  num_workers=args["j"], q=args["q"], size=args["size"], regions=regions, verbose=args["verbose"])
+    if not bins: close("No bins in the normal and tumor samples!\n")
 
     log(msg="# Writing the read counts for bins of normal sample\n", level="STEP")
     if args["outputNormal"] is not None:
         with open(args["outputNormal"], 'w') as f:
             for c in args["chromosomes"]:
-                for count in normal_bins[args["normal"][1], c]:
+                for count in bins[args["normal"][1], c]:
                     f.write("{}\t{}\t{}\t{}\t{}\n".format(count[0], count[1], count[2], count[3], count[4]))
     else:
         for c in args["chromosomes"]:
-            for count in normal_bins[args["normal"][1], c]:
+            for count in bins[args["normal"][1], c]:
                 sys.stdout.write("{}\t{}\t{}\t{}\t{}\n".format(count[0], count[1], count[2], count[3], count[4]))
 
-    log(msg="# Binning and counting the tumor samples\n", level="STEP")
-    tumor_bins = bb.bin(samtools=args["samtools"], samples=args["samples"], chromosomes=args["chromosomes"],
-                         num_workers=args["j"], q=args["q"], size=args["size"], regions=regions, verbose=args["verbose"])
-    if not tumor_bins: close("No bins in the tumor samples!\n")
-
     log(msg="# Writing the read counts for bins of tumor samples\n", level="STEP")
     if args["outputTumors"] is not None:
         with open(args["outputTumors"], 'w') as f:
             for sample in sorted(args["samples"]):
                 for c in args["chromosomes"]:
-                    for count in tumor_bins[sample[1], c]:
+                    for count in bins[sample[1], c]:
                         f.write("{}\t{}\t{}\t{}\t{}\n".format(count[0], count[1], count[2], count[3], count[4]))
     else:
         for sample in sorted(args["samples"]):
             for c in args["chromosomes"]:
-                for count in tumor_bins[sample[1], c]:
+                for count in bins[sample[1], c]:
                     sys.stdout.write("{}\t{}\t{}\t{}\t{}\n".format(count[0], count[1], count[2], count[3], count[4]))
 
     log(msg="# Counting total number of reads for normal and tumor samples\n", level="STEP")
@@ -45,7 +45,9 @@ def main(args=None):
             outbins.write("{}\t{}\t{}\t{}\t{}\t{}\t{}\t{}\t{}\t{}\t{}\n".format(key[0], key[1], key[2], sample[0], sample[1], sample[2], sample[3], sample[4], sample[5], sample[6], clusterAssignments[bintoidx[key]]))
 
     sp.log(msg="# Segmenting bins\n", level="STEP")
-    clusters = {cluster : set(key for key in combo if clusterAssignments[bintoidx[key]] == cluster) for cluster in set(clusterAssignments)}
+    clusters = {cluster : set() for cluster in set(clusterAssignments)}
+    for key in combo:
+        clusters[clusterAssignments[bintoidx[key]]].add(key)
     segments = segmentBins(bb=combo, clusters=clusters, samples=samples)
 
     if args["diploidbaf"] != None:
@@ -165,10 +167,7 @@ def cluster(points, output, samples, clouds=None, K=15, sf=0.01, restarts=10):
     LP = hmodel.calc_local_params(Data)
     fullAssignments = np.argmax(LP['resp'], axis=1)
 
-    numPoints = []
-    for i in range(numClusters):
-        currX = np.array([Data.X[j] for j in range(len(Data.X)) if fullAssignments[j] == i])
-        numPoints.append(currX.shape[0])
+    numPoints = np.bincount(fullAssignments, minlength=numClusters).tolist()
 
     return mus, sigmas, targetAssignments, numPoints, numClusters
 
@@ -176,11 +175,17 @@ def cluster(points, output, samples, clouds=None, K=15, sf=0.01, restarts=10):
 def refineClustering(combo, assign, assignidx, samples, rdtol, baftol):
     assignment = {b : assign[assignidx[b]] for b in combo}
     clusters = set(assignment[b] for b in assignment)
-    size = {c : float(sum(c == assignment[b] for b in combo)) for c in clusters}
-    getbaf = (lambda c, p : float(sum(e[6] for b in combo for e in combo[b] if assignment[b] == c and e[0] == p)))
-    baf = {c : {p : getbaf(c, p) / size[c] for p in samples} for c in clusters}
-    getrdr = (lambda c, p : float(sum(e[1] for b in combo for e in combo[b] if assignment[b] == c and e[0] == p)))
-    rdr = {c : {p : getrdr(c, p) / size[c] for p in samples} for c in clusters}
+    size = {c : 0.0 for c in clusters}
+    sumbaf = {c : {p : 0.0 for p in samples} for c in clusters}
+    sumrdr = {c : {p : 0.0 for p in samples} for c in clusters}
+    for b in combo:
+        c = assignment[b]
+        size[c] += 1.0
+        for e in combo[b]:
+            sumbaf[c][e[0]] += e[6]
+            sumrdr[c][e[0]] += e[1]
+    baf = {c : {p : sumbaf[c][p] / size[c] for p in samples} for c in clusters}
+    rdr = {c : {p : sumrdr[c][p] / size[c] for p in samples} for c in clusters}
 
     mbaf = (lambda c : {p : baf[c][p] for p in samples})
     mrdr = (lambda c : {p : rdr[c][p] for p in samples})
@@ -233,13 +238,12 @@ def refineClustering(combo, assign, assignidx, samples, rdtol, baftol):
 
 def generateClouds(points, density, seed, sdeven=0.02, sdodd=0.02):
     res = []
-    resappend = res.append
+    resextend = res.extend
     for point in points:
         np.random.seed(seed=seed)
-        for d in range(density):
-            normal = np.random.normal
-            newpoint = [normal(point[i], sdeven) if i%2==0 else normal(point[i], sdodd) for i in range(len(point))]
-            resappend(newpoint)
+        sd = [sdeven if i%2==0 else sdodd for i in range(len(point))]
+        # Draws all the points of the cloud at once, in the same order as drawing them one by one
+        resextend(np.random.normal(point, sd, size=(density, len(point))).tolist())
     return res
 
 
@@ -1,13 +1,11 @@
 import pytest
 import sys
 import os
-import glob
-from io import BytesIO as StringIO
 from mock import patch
 import hashlib
 import shutil
+import numpy as np
 import pandas as pd
-from pandas.util.testing import assert_frame_equal
 
 import hatchet
 from hatchet import config
@@ -21,6 +19,27 @@ from hatchet.bin.HATCHet import main as main
 this_dir = os.path.dirname(__file__)
 SOLVE = os.path.join(os.path.dirname(hatchet.__file__), 'solve')
 
+# Explicit column schemas for the output tables, to skip pandas' type inference
+SEG_DTYPES = {'#ID': 'int64', 'SAMPLE': 'category', '#BINS': 'int64', 'RD': 'float32', '#SNPS': 'int64',
+              'COV': 'float32', 'ALPHA': 'int64', 'BETA': 'int64', 'BAF': 'float32'}
+UCN_DTYPES = {'#CHR': 'category', 'START': 'int64', 'END': 'int64', 'SAMPLE': 'category', 'RD': 'float32',
+              '#SNPS': 'int64', 'COV': 'float32', 'ALPHA': 'int64', 'BETA': 'int64', 'BAF': 'float32',
+              'CLUSTER': 'int64', 'cn_normal': 'category', 'u_normal': 'float32', 'cn_clone1': 'category',
+              'u_clone1': 'float32'}
+
+
+def assert_tables_close(df1, df2):
+    # Column-wise comparison in NumPy: exact for integer/categorical columns, up to a tolerance for floats
+    assert list(df1.columns) == list(df2.columns)
+    assert len(df1) == len(df2)
+    for c in df1.columns:
+        if pd.api.types.is_float_dtype(df1[c]):
+            np.testing.assert_allclose(df1[c].to_numpy(np.float32), df2[c].to_numpy(np.float32), rtol=1e-5, err_msg=c)
+        elif pd.api.types.is_integer_dtype(df1[c]):
+            np.testing.assert_array_equal(df1[c].to_numpy(), df2[c].to_numpy(), err_msg=c)
+        else:
+            np.testing.assert_array_equal(df1[c].astype(str).to_numpy(), df2[c].astype(str).to_numpy(), err_msg=c)
+
 
 @pytest.fixture(scope='module')
 def bams():
@@ -28,7 +47,8 @@ def bams():
     normal_bam = os.path.join(bam_directory, 'normal.bam')
     if not os.path.exists(normal_bam):
         pytest.skip('File not found: {}/{}'.format(bam_directory, normal_bam))
-    tumor_bams = sorted([f for f in glob.glob(bam_directory + '/*.bam') if os.path.basename(f) != 'normal.bam'])
+    tumor_bams = sorted(os.path.join(bam_directory, f) for f in os.listdir(bam_directory)
+                        if f.endswith('.bam') and f != 'normal.bam')
     if not tumor_bams:
         pytest.skip('No tumor bams found in {}'.format(bam_directory))
 
@@ -89,23 +109,20 @@ def test_script(_, bams, output_folder):
         ]
     )
 
+    # comBBo writes the BB file through sys.stdout, stream it directly to disk
     _stdout = sys.stdout
-    sys.stdout = StringIO()
-
-    comBBo(args=[
-        '-c', os.path.join(output_folder, 'bin/normal.bin'),
-        '-C', os.path.join(output_folder, 'bin/bulk.bin'),
-        '-B', os.path.join(output_folder, 'baf/bulk.baf'),
-        '-m', 'MIRROR',
-        '-e', '12'
-    ])
-
-    out = sys.stdout.getvalue()
-    sys.stdout.close()
-    sys.stdout = _stdout
-
     with open(os.path.join(output_folder, 'bb/bulk.bb'), 'w') as f:
-        f.write(out)
+        sys.stdout = f
+        try:
+            comBBo(args=[
+                '-c', os.path.join(output_folder, 'bin/normal.bin'),
+                '-C', os.path.join(output_folder, 'bin/bulk.bin'),
+                '-B', os.path.join(output_folder, 'baf/bulk.baf'),
+                '-m', 'MIRROR',
+                '-e', '12'
+            ])
+        finally:
+            sys.stdout = _stdout
 
     cluBB(args=[
         os.path.join(output_folder, 'bb/bulk.bb'),
@@ -117,9 +134,11 @@ def test_script(_, bams, output_folder):
         '-d', '0.4'
     ])
 
-    df1 = pd.read_csv(os.path.join(output_folder, 'bbc/bulk.seg'), sep='\t')
-    df2 = pd.read_csv(os.path.join(this_dir, 'data', 'bulk.seg'), sep='\t')
-    assert_frame_equal(df1, df2)
+    df1 = pd.read_csv(os.path.join(output_folder, 'bbc/bulk.seg'), sep='\t', dtype=SEG_DTYPES,
+                      engine='c', float_precision='high')
+    df2 = pd.read_csv(os.path.join(this_dir, 'data', 'bulk.seg'), sep='\t', dtype=SEG_DTYPES,
+                      engine='c', float_precision='high')
+    assert_tables_close(df1, df2)
 
     if os.getenv('GRB_LICENSE_FILE') is not None:
         main(args=[
@@ -138,6 +157,8 @@ def test_script(_, bams, output_folder):
             '-l', '0.6'
         ])
 
-        df1 = pd.read_csv(os.path.join(output_folder, 'results/best.bbc.ucn'), sep='\t')
-        df2 = pd.read_csv(os.path.join(this_dir, 'data', 'best.bbc.ucn'), sep='\t')
-        assert_frame_equal(df1, df2)
+        df1 = pd.read_csv(os.path.join(output_folder, 'results/best.bbc.ucn'), sep='\t', dtype=UCN_DTYPES,
+                          engine='c', float_precision='high')
+        df2 = pd.read_csv(os.path.join(this_dir, 'data', 'best.bbc.ucn'), sep='\t', dtype=UCN_DTYPES,
+                          engine='c', float_precision='high')
+        assert_tables_close(df1, df2)